@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 import json
+import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
+
+import numpy as np
+import orjson
 
 from .github_utils import *
 from .theme_manager import ThemeManager
@@ -19,34 +23,98 @@ ERROR_MESSAGES = {
           "⚠️ 유효성 검사에 실패 했거나, 엔드 포인트가 스팸 처리되었습니다.")
 }
 
+# 주차 계산용 상수 (KST = UTC+9)
+KST_OFFSET_SECONDS = 9 * 3600
+SECONDS_PER_WEEK = 7 * 24 * 3600
+
+# Link 헤더에서 rel="last" URL의 page 값 추출 (쿼리 파라미터 순서와 무관)
+_LINK_LAST_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
 logger = logging.getLogger(__name__)
 
 
+# 점수 구간(10점 단위)별 이모지
+_EMOJIS = (
+    "🌑",  # 0~9: 최소 참여
+    "🍁",  # 10~19: 참여 시작
+    "🍂",  # 20~29: 개선 필요
+    "🌿",  # 30~39: 초기 단계
+    "🍀",  # 40~49: 발전 가능성
+    "🌱",  # 50~59: 성장 중
+    "🎨",  # 60~69: 양호한 성과
+    "🎯",  # 70~79: 목표 달성
+    "⭐",  # 80~89: 탁월한 성과
+    "🌟",  # 90 이상: 최상위 성과
+)
+
+
 def get_emoji(score):
-    if score >= 90:
-        return "🌟"  # 최상위 성과
-    elif score >= 80:
-        return "⭐"  # 탁월한 성과
-    elif score >= 70:
-        return "🎯"  # 목표 달성
-    elif score >= 60:
-        return "🎨"  # 양호한 성과
-    elif score >= 50:
-        return "🌱"  # 성장 중
-    elif score >= 40:
-        return "🍀"  # 발전 가능성
-    elif score >= 30:
-        return "🌿"  # 초기 단계
-    elif score >= 20:
-        return "🍂"  # 개선 필요
-    elif score >= 10:
-        return "🍁"  # 참여 시작
-    else:
-        return "🌑"  # 최소 참여
+    idx = int(score) // 10
+    return _EMOJIS[9 if idx >= 9 else max(idx, 0)]
+
+
+def _score_kernel(p_f: np.ndarray, p_b: np.ndarray, p_d: np.ndarray, p_t: np.ndarray,
+                  i_f: np.ndarray, i_b: np.ndarray, i_d: np.ndarray,
+                  weights: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    참여자별 카운트 배열로부터 조정된 카운트와 총점을 계산합니다.
+
+    Args:
+        p_f, p_b, p_d, p_t: 참여자별 enhancement / bug / documentation / typo PR 수
+        i_f, i_b, i_d: 참여자별 enhancement / bug / documentation 이슈 수
+        weights: (feat_bug_pr, doc_pr, typo_pr, feat_bug_is, doc_is) 가중치 배열
+
+    Returns:
+        (p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at, total, issue_only)
+        issue_only는 PR 없이 이슈만 있는 참여자 여부입니다.
+    """
+    p_fb = p_f + p_b
+    i_fb = i_f + i_b
+
+    # 유효 카운트 계산
+    p_valid = p_fb + np.minimum(p_d + p_t, 3 * np.maximum(p_fb, 1))
+
+    # ✅ PR 0개인데 이슈만 있는 경우 1:4 규칙 보정
+    # PR은 없지만, 이슈를 위해 PR 1개 있다고 간주 (계산용) - 실제 PR 점수는 0으로 고정
+    issue_only = (p_fb + p_d + p_t == 0) & (i_fb + i_d > 0)
+    p_valid = np.where(issue_only, 1, p_valid)
+    i_valid = np.minimum(i_fb + i_d, 4 * p_valid)
+
+    # 조정된 카운트 계산
+    p_fb_at = np.minimum(p_fb, p_valid)
+    p_d_at = np.minimum(p_d, p_valid - p_fb_at)
+    p_t_at = np.where(issue_only, 0, p_valid - p_fb_at - p_d_at)
+    i_fb_at = np.minimum(i_fb, i_valid)
+    i_d_at = i_valid - i_fb_at
+
+    # 총점 계산
+    total = weights @ np.stack([p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at])
+    return p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at, total, issue_only
 
 
 class RepoAnalyzer:
     """Class to analyze repository participation for scoring"""
+    # 인스턴스 속성 고정 (__dict__ 대신 slot 사용)
+    __slots__ = (
+        '_is_test_repo',
+        '_is_multiple_repos',
+        'dry_run',
+        'repo_path',
+        'participants',
+        'weekly_pr',
+        'weekly_issue',
+        '_first_week',
+        'semester_start_date',
+        '_semester_epoch',
+        'score',
+        '_weights',
+        'theme_manager',
+        '_data_collected',
+        '_RepoAnalyzer__previous_create_at',
+        '_etag_cache',
+        'SESSION',
+    )
+
     # 점수 가중치
     SCORE_WEIGHTS = {
         'feat_bug_pr': 3,
@@ -59,6 +127,24 @@ class RepoAnalyzer:
     # 사용자 제외 목록
     EXCLUDED_USERS = {"kyahnu", "kyagrd"}
 
+    # 첫 번째 라벨 → (PR 집계 필드, 이슈 집계 필드)
+    LABEL_TO_FIELD = {
+        'enhancement': ('p_enhancement', 'i_enhancement'),
+        'bug': ('p_enhancement', 'i_enhancement'),
+        'documentation': ('p_documentation', 'i_documentation'),
+        'typo': ('p_typo', None),
+    }
+
+    # 이슈 페이지 동시 요청 수 (GitHub rate limit 고려)
+    MAX_CONCURRENT_REQUESTS = 10
+    PER_PAGE = 100
+
+    # 이슈 페이지별 ETag/본문 캐시 (조건부 요청용)
+    ETAG_CACHE_PATH = os.path.join("cache", "etags.json")
+
+    # 저장소 존재 여부 캐시 (모든 인스턴스가 공유)
+    _EXISTS_CACHE: dict[str, bool] = {}
+
     def __init__(self, repo_path: str, theme: str = 'default', dry_run: bool = False):  # token 파라미터 제거 
         # 테스트용 저장소나 통합 분석용 저장소 식별
         self._is_test_repo = repo_path == "dummy/repo"
@@ -67,7 +153,10 @@ class RepoAnalyzer:
 
         # 테스트용이나 통합 분석용이 아닌 경우에만 실제 저장소 존재 여부 확인
         if not self._is_test_repo and not self._is_multiple_repos:
-            if not check_github_repo_exists(repo_path):  # 토큰 파라미터 제거
+            # 같은 저장소를 여러 번 분석해도 존재 확인 API는 한 번만 호출
+            if repo_path not in RepoAnalyzer._EXISTS_CACHE:
+                RepoAnalyzer._EXISTS_CACHE[repo_path] = check_github_repo_exists(repo_path)
+            if not RepoAnalyzer._EXISTS_CACHE[repo_path]:
                 logger.error(f"입력한 저장소 '{repo_path}'가 GitHub에 존재하지 않습니다.")
                 sys.exit(1)
         elif self._is_test_repo:
@@ -76,20 +165,43 @@ class RepoAnalyzer:
             logger.debug(f"ℹ️ [통합 분석] 여러 저장소의 통합 분석을 수행합니다.")
 
         self.repo_path = repo_path
-        self.participants: dict[str, dict[str, int]] = {}
-        self.weekly_activity = defaultdict(lambda: {'pr': 0, 'issue': 0})
+        self.participants: dict[str, dict[str, int]] = defaultdict(lambda: {
+            'p_enhancement': 0,
+            'p_bug': 0,
+            'p_documentation': 0,
+            'p_typo': 0,
+            'i_enhancement': 0,
+            'i_bug': 0,
+            'i_documentation': 0,
+        })
+        # 주차별 PR/이슈 수 (인덱스 0 = _first_week 주차)
+        self.weekly_pr = np.zeros(0, dtype=np.int32)
+        self.weekly_issue = np.zeros(0, dtype=np.int32)
+        self._first_week = 1
         self.semester_start_date = None
+        self._semester_epoch = None
 
         self.score = self.SCORE_WEIGHTS.copy()
+        # _score_kernel에 넘길 가중치 순서: (feat_bug_pr, doc_pr, typo_pr, feat_bug_is, doc_is)
+        self._weights = (
+            self.score['feat_bug_pr'],
+            self.score['doc_pr'],
+            self.score['typo_pr'],
+            self.score['feat_bug_is'],
+            self.score['doc_is']
+        )
 
         self.theme_manager = ThemeManager()  # 테마 매니저 초기화
         self.set_theme(theme)  # 테마 설정
 
         self._data_collected = True
         self.__previous_create_at = None
+        self._etag_cache: dict[str, dict] = {}
 
         # 환경변수에서 토큰을 읽어서 세션 설정
         self.SESSION = requests.Session()
+        # 동시 페이지 요청이 모두 keep-alive 연결을 재사용하도록 연결 풀 크기를 동시 요청 수에 맞춤
+        self.SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=self.MAX_CONCURRENT_REQUESTS))
         token = os.getenv('GITHUB_TOKEN')
         if token:
             self.SESSION.headers.update({
@@ -115,6 +227,32 @@ class RepoAnalyzer:
     def previous_create_at(self, value):
         self.__previous_create_at = datetime.fromtimestamp(value, tz=timezone.utc)
 
+    @property
+    def weekly_activity(self) -> dict[int, dict[str, int]]:
+        """활동이 있는 주차별 PR/이슈 수 ({주차: {'pr': n, 'issue': m}})"""
+        active = np.flatnonzero(self.weekly_pr + self.weekly_issue)
+        return {
+            week + self._first_week: {'pr': pr, 'issue': issue}
+            for week, pr, issue in zip(active.tolist(),
+                                       self.weekly_pr[active].tolist(),
+                                       self.weekly_issue[active].tolist())
+        }
+
+    def _count_weekly_activity(self, pr_weeks: list[int], issue_weeks: list[int]) -> None:
+        """
+        항목별 주차 목록을 주차별 PR/이슈 수 배열로 집계합니다.
+        학기 시작 전 항목은 0 이하의 주차가 되므로 가장 이른 주차를 기준으로 배열을 만듭니다.
+        """
+        if not pr_weeks and not issue_weeks:
+            return
+        first_week = min(pr_weeks + issue_weeks)
+        size = max(pr_weeks + issue_weeks) - first_week + 1
+        self._first_week = first_week
+        self.weekly_pr = np.bincount(np.array(pr_weeks, dtype=np.int64) - first_week,
+                                     minlength=size).astype(np.int32)
+        self.weekly_issue = np.bincount(np.array(issue_weeks, dtype=np.int64) - first_week,
+                                        minlength=size).astype(np.int32)
+
     def set_theme(self, theme_name: str) -> None:
         if theme_name in self.theme_manager.themes:
             self.theme_manager.current_theme = theme_name
@@ -122,15 +260,65 @@ class RepoAnalyzer:
             raise ValueError(f"지원하지 않는 테마입니다: {theme_name}")
 
     def _handle_api_error(self, status_code: int) -> bool:
-        if status_code in ERROR_MESSAGES:
-            logger.error(ERROR_MESSAGES[status_code])
-            self._data_collected = False
-            return True
-        elif status_code != 200:
+        if status_code == 200:  # 대부분의 응답은 정상이므로 먼저 확인
+            return False
+
+        message = ERROR_MESSAGES.get(status_code)
+        if message:
+            logger.error(message)
+        else:
             logger.warning(f"⚠️ GitHub API 요청 실패: {status_code}")
-            self._data_collected = False
-            return True
-        return False
+        self._data_collected = False
+        return True
+
+    def _load_etag_cache(self) -> dict[str, dict]:
+        """ETag 캐시 파일 로드 (없거나 손상된 경우 빈 캐시)"""
+        try:
+            with open(self.ETAG_CACHE_PATH, 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+    def _save_etag_cache(self) -> None:
+        """ETag 캐시를 파일로 저장"""
+        os.makedirs(os.path.dirname(self.ETAG_CACHE_PATH) or '.', exist_ok=True)
+        with open(self.ETAG_CACHE_PATH, 'wb') as f:
+            f.write(orjson.dumps(self._etag_cache))
+
+    def _fetch_issue_page(self, url: str, page: int) -> tuple[list, str] | None:
+        """
+        이슈 목록의 한 페이지를 요청하여 (items, Link 헤더)를 반환합니다.
+        캐시된 ETag가 있으면 조건부 요청을 보내고, 304 응답이면 캐시된 본문을 재사용합니다.
+        (304 응답은 rate limit에 포함되지 않습니다.)
+        """
+        cache_key = f"{url}?page={page}"
+        cached = self._etag_cache.get(cache_key)
+        headers = {'If-None-Match': cached['etag']} if cached else None
+
+        # 서버 측 필터(labels=, since=)는 사용하지 않음:
+        # - labels=a,b 는 "모든 라벨을 가진" 항목만 반환(AND 조건)하므로 라벨별 집계에 쓸 수 없음
+        # - since= 는 created_at이 아닌 updated_at 기준이고, 수집은 매번 전체를 다시 집계하므로
+        #   이전 항목이 누락되거나(병합 전 PR 등) 중복 집계될 수 있음
+        response = retry_request(self.SESSION,
+                                 url,
+                                 params={
+                                     'state': 'all',
+                                     'per_page': self.PER_PAGE,
+                                     'page': page
+                                 },
+                                 headers=headers)
+
+        if response.status_code == 304 and cached:
+            return cached['items'], cached['link']
+        if self._handle_api_error(response.status_code):
+            return None
+
+        items = orjson.loads(response.content)
+        link = response.headers.get('link', '')
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[cache_key] = {'etag': etag, 'link': link, 'items': items}
+        return items, link
 
     def collect_PRs_and_issues(self) -> None:
         """
@@ -150,121 +338,88 @@ class RepoAnalyzer:
             logger.info(f"ℹ️ [통합 분석] 통합 분석을 위한 저장소입니다. API 호출을 건너뜁니다.")
             return
 
-        page = 1
-        per_page = 100
+        url = f"https://api.github.com/repos/{self.repo_path}/issues"
 
-        while True:
-            url = f"https://api.github.com/repos/{self.repo_path}/issues"
+        # 첫 페이지의 Link 헤더(rel="last")로 전체 페이지 수를 알아낸 뒤
+        # 나머지 페이지는 동시에 요청합니다.
+        self._etag_cache = self._load_etag_cache()
 
-            response = retry_request(self.SESSION,
-                                     url,
-                                     params={
-                                         'state': 'all',
-                                         'per_page': per_page,
-                                         'page': page
-                                     })
-
-            # 🔽 에러 처리 부분 25줄 → 3줄로 리팩토링
-            if self._handle_api_error(response.status_code):
-                return
+        first_page = self._fetch_issue_page(url, 1)
+        if first_page is None:
+            return
 
-            items = response.json()
-            if not items:
-                break
+        items, link_header = first_page
+        pages = [items]
+        match = _LINK_LAST_PAGE_RE.search(link_header)
+        last_page = int(match.group(1)) if match else 1
+
+        if last_page > 1:
+            with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+                results = list(executor.map(
+                    lambda page: self._fetch_issue_page(url, page),
+                    range(2, last_page + 1)
+                ))
+            for result in results:
+                if result is None:
+                    return
+                pages.append(result[0])
 
+        latest_created_at = None
+        pr_weeks, issue_weeks = [], []
+        for items in pages:
             for item in items:
                 if 'created_at' not in item:
                     logger.warning(f"⚠️ 요청 분석 실패")
                     return
 
-                server_create_datetime = datetime.fromisoformat(item['created_at'])
+                # created_at은 고정 길이 UTC 문자열('YYYY-MM-DDTHH:MM:SSZ')이므로 문자열 비교로 최댓값을 구함
+                created_at = item['created_at']
+                if latest_created_at is None or created_at > latest_created_at:
+                    latest_created_at = created_at
 
-                if self.semester_start_date:
-                    created_date = server_create_datetime.astimezone(ZoneInfo("Asia/Seoul")).date()
-                    week_index = (created_date - self.semester_start_date).days // 7 + 1
-                    if 'pull_request' in item and item.get('pull_request', {}).get('merged_at'):
-                        self.weekly_activity[week_index]['pr'] += 1
-                    elif item.get('state_reason') in ('completed', 'reopened', None):
-                        self.weekly_activity[week_index]['issue'] += 1
+                # /issues 응답에 포함된 merged_at으로 병합 여부 판단 (PR API 추가 호출 없음)
+                pull_request = item.get('pull_request')
+                merged = pull_request is not None and bool(pull_request.get('merged_at'))
+                state_reason = item.get('state_reason')
 
-                self.__previous_create_at = server_create_datetime if self.__previous_create_at is None else max(self.__previous_create_at,server_create_datetime)
+                if self.semester_start_date:
+                    created_epoch = int(datetime.fromisoformat(created_at).timestamp())
+                    week_index = (created_epoch - self._semester_epoch) // SECONDS_PER_WEEK + 1
+                    if merged:
+                        pr_weeks.append(week_index)
+                    elif state_reason in ('completed', 'reopened', None):
+                        issue_weeks.append(week_index)
 
                 author = item.get('user', {}).get('login', 'Unknown')
-                if author not in self.participants:
-                    self.participants[author] = {
-                        'p_enhancement': 0,
-                        'p_bug': 0,
-                        'p_documentation': 0,
-                        'p_typo': 0,
-                        'i_enhancement': 0,
-                        'i_bug': 0,
-                        'i_documentation': 0,
-                    }
-
-                labels = item.get('labels', [])
-                label_names = [label.get('name', '') for label in labels if label.get('name')]
-
-                state_reason = item.get('state_reason')
+                activity = self.participants[author]  # 처음 등장한 작성자는 0으로 초기화
 
-                # PR 처리 (병합된 PR만)
-                if 'pull_request' in item:
-                    # 이슈 객체에서 PR 번호 꺼내기
-                    pr_number = item.get('number')
-                    if pr_number is None:
+                # PR은 병합된 것만, 이슈는 open / reopened / completed 만 포함 (not planned 제외)
+                # 집계 대상이 아니면 라벨을 확인하지 않음
+                if pull_request is not None:
+                    if not merged:
                         continue
-                    
-                    if 'pull_request' in item:
-                        pr_number = item.get('number')
-                        if pr_number is None:
-                            continue
-
-                        merged = False
-
-                        merged_at_inline = item.get('pull_request', {}).get('merged_at')
-                        if merged_at_inline:
-                            merged = True
-
-                    elif item.get('state') == 'closed':
-                        pr_url = f"https://api.github.com/repos/{self.repo_path}/pulls/{pr_number}"
-                        try:
-                            pr_resp = retry_request(self.SESSION, pr_url)
-                        except Exception:
-                            continue
-                        if self._handle_api_error(pr_resp.status_code):
-                            continue
-                        pr_data = pr_resp.json()
-                        merged = bool(pr_data.get('merged_at'))
-                        
-                    if merged:
-                        # JS와 동일하게 첫 번째 라벨만 사용
-                        if label_names:
-                            first_label = label_names[0]
-                            if first_label in ['enhancement', 'bug']:
-                                self.participants[author]['p_enhancement'] += 1
-                            elif first_label == 'documentation':
-                                self.participants[author]['p_documentation'] += 1
-                            elif first_label == 'typo':
-                                self.participants[author]['p_typo'] += 1
-
-                # 이슈 처리 (open / reopened / completed 만 포함, not planned 제외)
+                    field_index = 0
+                elif state_reason in ('completed', 'reopened', None):
+                    field_index = 1
                 else:
-                    if state_reason in ('completed', 'reopened', None):
-                        # JS와 동일하게 첫 번째 라벨만 사용
-                        if label_names:  # 라벨이 존재하는 경우만
-                            first_label = label_names[0]  # 첫 번째 라벨만 선택
-                            if first_label in ['enhancement', 'bug']:
-                                self.participants[author]['i_enhancement'] += 1
-                            elif first_label == 'documentation':
-                                self.participants[author]['i_documentation'] += 1
-
-            # 다음 페이지 검사
-            link_header = response.headers.get('link', '')
-            if 'rel="next"' in link_header:
-                page += 1
-            else:
-                break
+                    continue
+
+                # JS와 동일하게 첫 번째 라벨만 사용
+                labels = item.get('labels')
+                first_label = labels[0].get('name') if labels else None
+                entry = self.LABEL_TO_FIELD.get(first_label)
+                if entry and entry[field_index]:
+                    activity[entry[field_index]] += 1
+
+        if latest_created_at is not None:
+            server_create_datetime = datetime.fromisoformat(latest_created_at)
+            self.__previous_create_at = server_create_datetime if self.__previous_create_at is None else max(self.__previous_create_at, server_create_datetime)
+
+        self._count_weekly_activity(pr_weeks, issue_weeks)
+        self._save_etag_cache()
 
         if not self.participants:
+            self.participants = {}
             logger.warning("⚠️ 수집된 데이터가 없습니다. (참여자 없음)")
             logger.info("📄 참여자는 없지만, 결과 파일은 생성됩니다.")
         else:
@@ -276,150 +431,75 @@ class RepoAnalyzer:
             for user, info in self.participants.items():
                 logger.debug(f"{user}: {info}")
 
-    def _extract_pr_counts(self, activities: dict) -> tuple[int, int, int, int, int]:
-        """PR 관련 카운트 추출"""
-        p_f = activities.get('p_enhancement', 0)
-        p_b = activities.get('p_bug', 0)
-        p_d = activities.get('p_documentation', 0)
-        p_t = activities.get('p_typo', 0)
-        p_fb = p_f + p_b
-        return p_f, p_b, p_d, p_t, p_fb
-
-    def _extract_issue_counts(self, activities: dict) -> tuple[int, int, int, int]:
-        """이슈 관련 카운트 추출"""
-        i_f = activities.get('i_enhancement', 0)
-        i_b = activities.get('i_bug', 0)
-        i_d = activities.get('i_documentation', 0)
-        i_fb = i_f + i_b
-        return i_f, i_b, i_d, i_fb
-
-    def _calculate_valid_counts(self, p_fb: int, p_d: int, p_t: int, i_fb: int, i_d: int) -> tuple[int, int]:
-        """유효한 카운트 계산"""
-        p_valid = p_fb + min(p_d + p_t, 3 * max(p_fb, 1))
-        i_valid = min(i_fb + i_d, 4 * p_valid)
-        return p_valid, i_valid
-
-    def _calculate_adjusted_counts(self, p_fb: int, p_d: int, p_valid: int, i_fb: int, i_valid: int) -> tuple[int, int, int, int, int]:
-        """조정된 카운트 계산"""
-        p_fb_at = min(p_fb, p_valid)
-        p_d_at = min(p_d, p_valid - p_fb_at)
-        p_t_at = p_valid - p_fb_at - p_d_at
-        i_fb_at = min(i_fb, i_valid)
-        i_d_at = i_valid - i_fb_at
-        return p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at
-
-    def _calculate_total_score(self, p_fb_at: int, p_d_at: int, p_t_at: int, i_fb_at: int, i_d_at: int) -> int:
-        """총점 계산"""
-        return (
-                self.score['feat_bug_pr'] * p_fb_at +
-                self.score['doc_pr'] * p_d_at +
-                self.score['typo_pr'] * p_t_at +
-                self.score['feat_bug_is'] * i_fb_at +
-                self.score['doc_is'] * i_d_at
-        )
-
-    def _create_score_dict(self, p_fb_at: int, p_d_at: int, p_t_at: int, i_fb_at: int, i_d_at: int, total: int) -> dict[str, float]:
-        """점수 딕셔너리 생성"""
-        return {
-            "feat/bug PR": self.score['feat_bug_pr'] * p_fb_at,
-            "document PR": self.score['doc_pr'] * p_d_at,
-            "typo PR": self.score['typo_pr'] * p_t_at,
-            "feat/bug issue": self.score['feat_bug_is'] * i_fb_at,
-            "document issue": self.score['doc_is'] * i_d_at,
-            "total": total
-        }
-
     def _finalize_scores(self, scores: dict, total_score_sum: float, user_info: dict | None = None) -> dict[str, dict[str, float]]:
         """최종 점수 계산 및 정렬"""
-        # 비율 계산
-        for participant in scores:
-            total = scores[participant]["total"]
-            rate = (total / total_score_sum) * 100 if total_score_sum > 0 else 0
-            scores[participant]["rate"] = round(rate, 1)
-
         # 사용자 정보 매핑 (제공된 경우)
         if user_info:
-            new_scores = {}
-            for k in list(scores.keys()):
-                display_name = user_info.get(k, k)
-                new_scores[display_name] = scores[k]
-            scores = new_scores
+            scores = {user_info.get(k, k): data for k, data in scores.items()}
 
+        if not scores:
+            return {}
+
+        users = list(scores)
+        n = len(users)
+        totals = np.fromiter((data["total"] for data in scores.values()), dtype=np.float64, count=n)
 
-        sorted_items = sorted(scores.items(), key=lambda x: x[1]["total"], reverse=True)
+        # 총점 내림차순 정렬 (동점은 기존 순서 유지)
+        order = np.argsort(-totals, kind='stable')
+        sorted_totals = totals[order]
+
+        # 공동 등수 처리: 총점이 바뀌는 위치의 순번을 등수로 사용 (1, 1, 3, ...)
+        is_new_score = np.concatenate(([True], sorted_totals[1:] != sorted_totals[:-1]))
+        ranks = np.maximum.accumulate(np.where(is_new_score, np.arange(1, n + 1), 0))
+
+        # 비율 계산
+        if total_score_sum > 0:
+            rates = (totals / total_score_sum * 100).tolist()
+        else:
+            rates = [0] * n
 
-        # 공동 등수 처리
         ranked_scores = {}
-        last_score = None
-        current_rank = 0
-        rank_counter = 0
-
-        for user, data in sorted_items:
-            rank_counter += 1
-            if data["total"] != last_score:
-                current_rank = rank_counter
-                last_score = data["total"]
-            data["rank"] = current_rank
-            ranked_scores[user] = data
+        for i, rank in zip(order.tolist(), ranks.tolist()):
+            data = scores[users[i]]
+            data["rate"] = round(rates[i], 1)
+            data["rank"] = rank
+            ranked_scores[users[i]] = data
 
         return ranked_scores
 
     def calculate_scores(self, user_info: dict[str, str] | None = None, min_contributions: int = 0) -> dict[str, dict[str, float]]:
-        """참여자별 점수 계산"""
+        """참여자별 점수 계산 (참여자별 카운트를 항목별 배열로 모아 한 번에 계산)"""
+        users = list(self.participants)
+        n = len(users)
+
+        def column(key: str) -> np.ndarray:
+            return np.fromiter((self.participants[user].get(key, 0) for user in users), dtype=np.int64, count=n)
+
+        weights = np.array(self._weights, dtype=np.int64)
+        p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at, total, issue_only = _score_kernel(
+            column('p_enhancement'), column('p_bug'), column('p_documentation'), column('p_typo'),
+            column('i_enhancement'), column('i_bug'), column('i_documentation'), weights
+        )
+        total_score_sum = int(total.sum())
+
+        # 항목별 점수
+        fb_pr, d_pr, t_pr, fb_is, d_is = (
+            weights[:, None] * np.stack([p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at])
+        ).tolist()
+
         scores = {}
-        total_score_sum = 0
-
-        for participant, activities in self.participants.items():
-            # PR 카운트 추출
-            p_f, p_b, p_d, p_t, p_fb = self._extract_pr_counts(activities)
-
-            # 이슈 카운트 추출
-            i_f, i_b, i_d, i_fb = self._extract_issue_counts(activities)
-
-            # 유효 카운트 계산
-            p_valid, i_valid = self._calculate_valid_counts(p_fb, p_d, p_t, i_fb, i_d)
-
-            # ✅ PR 0개인데 이슈만 있는 경우 1:4 규칙 보정
-            if p_fb == 0 and p_d == 0 and p_t == 0 and (i_fb + i_d) > 0:
-                # PR은 없지만, 이슈를 위해 PR 1개 있다고 간주 (계산용)
-                p_valid = 1
-                i_valid = min(i_fb + i_d, 4 * p_valid)
-
-                # 💡 실제 PR 점수는 0으로 고정
-                p_fb_at = 0
-                p_d_at = 0
-                p_t_at = 1 if p_t > 0 else 0  # typo 1개 있으면 점수 부여
-                i_fb_at = min(i_fb, i_valid)
-                i_d_at = i_valid - i_fb_at
-
-                total = (
-                        self.score['feat_bug_is'] * i_fb_at +
-                        self.score['doc_is'] * i_d_at +
-                        self.score['typo_pr'] * p_t_at
-                )
-
-                scores[participant] = {
-                    "feat/bug PR": 0.0,
-                    "document PR": 0.0,
-                    "typo PR": 0.0,
-                    "feat/bug issue": self.score['feat_bug_is'] * i_fb_at,
-                    "document issue": self.score['doc_is'] * i_d_at,
-                    "total": total
-                }
-
-                total_score_sum += total
-                continue
-
-            # 조정된 카운트 계산
-            p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at = self._calculate_adjusted_counts(
-                p_fb, p_d, p_valid, i_fb, i_valid
-            )
-
-            # 총점 계산
-            total = self._calculate_total_score(p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at)
-
-            scores[participant] = self._create_score_dict(p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at, total)
-            total_score_sum += total
+        rows = zip(users, issue_only.tolist(), fb_pr, d_pr, t_pr, fb_is, d_is, total.tolist())
+        for participant, only_issue, fb_pr_score, d_pr_score, t_pr_score, fb_is_score, d_is_score, total_score in rows:
+            if only_issue:
+                fb_pr_score = d_pr_score = t_pr_score = 0.0
+            scores[participant] = {
+                "feat/bug PR": fb_pr_score,
+                "document PR": d_pr_score,
+                "typo PR": t_pr_score,
+                "feat/bug issue": fb_is_score,
+                "document issue": d_is_score,
+                "total": total_score
+            }
 
         if min_contributions > 0:
             scores = {user: s for user, s in scores.items() if s["total"] >= min_contributions}
@@ -429,6 +509,8 @@ class RepoAnalyzer:
     def set_semester_start_date(self, date: datetime.date) -> None:
         """--semester-start 옵션에서 받은 학기 시작일 저장"""
         self.semester_start_date = date
+        # 학기 시작일 0시(KST)의 epoch 초. KST는 DST 없는 UTC+9 고정이므로 항목마다 시간대 변환할 필요가 없음
+        self._semester_epoch = int(datetime.combine(date, datetime.min.time(), tzinfo=timezone.utc).timestamp()) - KST_OFFSET_SECONDS
 
     def calculate_averages(self, scores: dict[str, dict[str, float]]) -> dict[str, float]:
         """점수 딕셔너리에서 각 카테고리별 평균을 계산합니다."""
@@ -1,6 +1,7 @@
+import json
 import os
 import tempfile
-from reposcore.analyzer import RepoAnalyzer
+from reposcore.analyzer import RepoAnalyzer, get_emoji
 from reposcore.output_handler import OutputHandler
 
 def test_example_calculate_scores():
@@ -213,3 +214,99 @@ def test_generate_chart_creates_file():
         filepath = os.path.join(tmpdir, "test_chart.png")
         output_handler.generate_chart(scores, save_path=filepath)
         assert os.path.isfile(filepath),"차트 이미지 파일이 생성되지 않았습니다."
+
+
+class FakeResponse:
+    def __init__(self, items, link="", status_code=200, headers=None):
+        self._items = items
+        self.status_code = status_code
+        self.headers = {"link": link, **(headers or {})}
+
+    @property
+    def content(self):
+        return json.dumps(self._items).encode()
+
+
+def make_issue(author, label, merged_at=None, is_pr=False, created_at="2025-03-10T01:00:00Z"):
+    item = {
+        "number": 1,
+        "created_at": created_at,
+        "user": {"login": author},
+        "labels": [{"name": label}],
+        "state_reason": None,
+    }
+    if is_pr:
+        item["pull_request"] = {"merged_at": merged_at}
+    return item
+
+
+def test_collect_fetches_all_pages(monkeypatch, tmp_path):
+    monkeypatch.setattr(RepoAnalyzer, "_EXISTS_CACHE", {"owner/repo": True})
+    monkeypatch.setattr(RepoAnalyzer, "ETAG_CACHE_PATH", str(tmp_path / "etags.json"))
+    pages = {
+        1: FakeResponse(
+            [make_issue("alice", "bug", "2025-03-11T00:00:00Z", is_pr=True)],
+            link='<https://api.github.com/repositories/1/issues?state=all&per_page=100&page=3>; rel="last"'
+        ),
+        2: FakeResponse([make_issue("bob", "documentation")]),
+        3: FakeResponse([make_issue("alice", "enhancement", is_pr=True)]),  # 병합되지 않은 PR
+    }
+    requested = []
+
+    def fake_request(session, url, params=None, headers=None):
+        requested.append(params["page"])
+        return pages[params["page"]]
+
+    monkeypatch.setattr("reposcore.analyzer.retry_request", fake_request)
+
+    analyzer = RepoAnalyzer("owner/repo")
+    analyzer.collect_PRs_and_issues()
+
+    assert sorted(requested) == [1, 2, 3]
+    assert analyzer.participants["alice"]["p_enhancement"] == 1
+    assert analyzer.participants["bob"]["i_documentation"] == 1
+
+
+def test_collect_reuses_cached_page_on_304(monkeypatch, tmp_path):
+    monkeypatch.setattr(RepoAnalyzer, "_EXISTS_CACHE", {"owner/repo": True})
+    monkeypatch.setattr(RepoAnalyzer, "ETAG_CACHE_PATH", str(tmp_path / "etags.json"))
+    sent_headers = []
+
+    def fake_request(session, url, params=None, headers=None):
+        sent_headers.append(headers)
+        if headers and headers.get("If-None-Match") == '"abc"':
+            return FakeResponse(None, status_code=304)
+        return FakeResponse([make_issue("bob", "bug")], headers={"ETag": '"abc"'})
+
+    monkeypatch.setattr("reposcore.analyzer.retry_request", fake_request)
+
+    RepoAnalyzer("owner/repo").collect_PRs_and_issues()
+    analyzer = RepoAnalyzer("owner/repo")
+    analyzer.collect_PRs_and_issues()
+
+    assert sent_headers == [None, {"If-None-Match": '"abc"'}]
+    assert analyzer.participants["bob"]["i_enhancement"] == 1
+
+
+def test_get_emoji_score_buckets():
+    assert get_emoji(0) == "🌑"
+    assert get_emoji(9.9) == "🌑"
+    assert get_emoji(10) == "🍁"
+    assert get_emoji(55) == "🌱"
+    assert get_emoji(89.5) == "⭐"
+    assert get_emoji(90) == "🌟"
+    assert get_emoji(150) == "🌟"
+
+
+def test_finalize_scores_shares_rank_on_ties():
+    analyzer = RepoAnalyzer("dummy/repo")
+    scores = {
+        "a": {"total": 5},
+        "b": {"total": 9},
+        "c": {"total": 5},
+        "d": {"total": 1},
+    }
+    ranked = analyzer._finalize_scores(scores, 20, {"b": "Bob"})
+    assert list(ranked) == ["Bob", "a", "c", "d"]
+    assert [data["rank"] for data in ranked.values()] == [1, 2, 2, 4]
+    assert ranked["Bob"]["rate"] == 45.0